@@ -9,16 +9,33 @@ Run:
     uvicorn backend:app --host 0.0.0.0 --port 8443
 """
 
-from fastapi import FastAPI, Header, HTTPException, Query
+from fastapi import FastAPI, Header, HTTPException, Query, Request, Response
+from fastapi.concurrency import run_in_threadpool
 from fastapi.staticfiles import StaticFiles
-from pydantic import BaseModel, Field, field_validator
-from contextlib import asynccontextmanager
+
+# orjson serializes large JSON bodies several times faster than the
+# stdlib encoder; fall back to the default response class without it
+try:
+    import orjson  # noqa: F401
+    from fastapi.responses import ORJSONResponse as FastJSONResponse
+except ImportError:
+    orjson = None
+    from fastapi.responses import JSONResponse as FastJSONResponse
+from pydantic import BaseModel, Field, constr
+from contextlib import asynccontextmanager, contextmanager
+from functools import cached_property
+import anyio.to_thread
+import asyncio
+import queue
 import sqlite3
 from datetime import datetime, timedelta
 import json
-from typing import Optional, List
+from typing import Literal, Optional, List
 import os
+import base64
+import hashlib
 import secrets
+import time
 from pathlib import Path
 
 # Configuration
@@ -35,20 +52,179 @@ if len(API_KEY) < MIN_API_KEY_LENGTH:
     raise RuntimeError(
         f"SANTAMON_API_KEY must be at least {MIN_API_KEY_LENGTH} characters long"
     )
+# Encoded once so each request compares against precomputed bytes
+_API_KEY_BYTES = API_KEY.encode()
 
-# Connection pool (simple approach for SQLite)
-_db_lock = None
-try:
-    import threading
-    _db_lock = threading.Lock()
-except ImportError:
-    pass
+
+def _check_api_key(x_api_key: Optional[str]) -> None:
+    """Reject with 401 unless the header matches, compared in constant time."""
+    if not x_api_key or not secrets.compare_digest(
+        x_api_key.encode(), _API_KEY_BYTES
+    ):
+        raise HTTPException(status_code=401, detail="Invalid API key")
+
+
+# SQLite allows one writer but many concurrent readers in WAL mode, so
+# connections are split accordingly: a single read-write connection
+# serialized by an asyncio lock, plus a pool of read-only connections so
+# /signals, /stats and /agents scans never contend with ingest commits.
+POOL_SIZE = int(os.getenv("SANTAMON_POOL_SIZE", "4"))
+_read_pool: "queue.Queue[sqlite3.Connection]" = queue.Queue()
+_write_conn: Optional[sqlite3.Connection] = None
+_write_lock = asyncio.Lock()
+
+
+# How long a connection retries on SQLITE_BUSY before giving up
+BUSY_TIMEOUT_MS = 5000
+
+
+def _connect(readonly: bool = False) -> sqlite3.Connection:
+    """Open a connection with the performance PRAGMAs applied.
+
+    journal_mode is a persistent database-level setting (set once at
+    startup in lifespan); mmap_size, synchronous, temp_store,
+    cache_size and busy_timeout are per-connection and must be
+    reapplied here.
+    """
+    if readonly:
+        conn = sqlite3.connect(
+            f"file:{DB_PATH}?mode=ro", uri=True,
+            check_same_thread=False, cached_statements=256,
+        )
+    else:
+        # IMMEDIATE makes write transactions take the write lock at
+        # BEGIN instead of upgrading from a deferred read lock mid-way,
+        # which is where SQLITE_BUSY deadlocks come from
+        conn = sqlite3.connect(
+            DB_PATH, check_same_thread=False, cached_statements=256,
+            isolation_level="IMMEDIATE",
+        )
+        conn.execute("PRAGMA synchronous=NORMAL")
+    conn.row_factory = sqlite3.Row
+    conn.execute(f"PRAGMA busy_timeout={BUSY_TIMEOUT_MS}")
+    conn.execute("PRAGMA temp_store=MEMORY")
+    conn.execute("PRAGMA cache_size=-64000")
+    # Memory-map the database file so reads hit the page cache directly
+    # instead of going through read() syscalls
+    conn.execute("PRAGMA mmap_size=268435456")
+    return conn
+
+
+# SQL for the hot paths, defined once so sqlite3's per-connection
+# statement cache (keyed by exact SQL text) skips re-parsing on every
+# request.
+_INSERT_SIGNAL_SQL = """
+    INSERT OR IGNORE INTO signals (
+        signal_id, ts, host_id, rule_id, rule_description, status,
+        severity, title, tags, context, received_at
+    ) VALUES
+    (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+_INSERT_HEARTBEAT_SQL = """
+    INSERT OR REPLACE INTO heartbeats VALUES
+    (?, ?, ?, ?, ?, ?)
+"""
+_INSERT_TAG_SQL = "INSERT OR IGNORE INTO signal_tags (signal_id, tag) VALUES (?, ?)"
+_UPDATE_STATUS_SQL = "UPDATE signals SET status = ? WHERE signal_id = ?"
+# SQLite's bare-column rule guarantees the non-aggregated columns come
+# from the row holding MAX(received_at), i.e. each agent's latest beat
+_SELECT_AGENTS_SQL = """
+    SELECT agent_id, timestamp, version, os_version, uptime_seconds,
+           MAX(received_at) AS received_at
+    FROM heartbeats
+    WHERE received_at > ?
+    GROUP BY agent_id
+    ORDER BY received_at DESC
+    LIMIT ?
+"""
+
+
+# received_at records when the backend saw an event and only needs
+# second granularity, so the formatted string is cached and refreshed
+# when the clock ticks over instead of calling isoformat() per write.
+_now_cache = (0, "")
+
+
+def _utcnow_iso() -> str:
+    global _now_cache
+    second = int(time.time())
+    if second != _now_cache[0]:
+        _now_cache = (second, datetime.utcfromtimestamp(second).isoformat())
+    return _now_cache[1]
+
+
+def _conditional_json(request: Request, payload: dict) -> Response:
+    """Serialize payload once and answer 304 when the client's ETag matches.
+
+    Polling dashboards mostly see unchanged data, so matching
+    If-None-Match saves re-sending (and the client re-parsing) the body.
+    """
+    if orjson is not None:
+        body = orjson.dumps(payload)
+    else:
+        body = json.dumps(payload, separators=(",", ":")).encode()
+    etag = f'"{hashlib.md5(body).hexdigest()}"'
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers={"ETag": etag})
+    return Response(body, media_type="application/json", headers={"ETag": etag})
+
+
+# The pagination cursor is base64 over a JSON pair rather than a joined
+# string: signal_id is caller-supplied free text, so no delimiter could
+# be split back unambiguously.
+def _encode_cursor(ts: str, signal_id: str) -> str:
+    return base64.urlsafe_b64encode(json.dumps([ts, signal_id]).encode()).decode()
+
+
+def _decode_cursor(cursor: str) -> tuple:
+    try:
+        ts, signal_id = json.loads(base64.urlsafe_b64decode(cursor))
+        if not isinstance(ts, str) or not isinstance(signal_id, str):
+            raise ValueError
+    except (ValueError, TypeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    return ts, signal_id
+
+
+@contextmanager
+def get_conn():
+    """Borrow a read-only pooled connection, returning it when done."""
+    conn = _read_pool.get()
+    try:
+        yield conn
+    finally:
+        _read_pool.put(conn)
+
+
+@contextmanager
+def _write_tx():
+    """Guard a writer transaction, rolling back if any statement fails.
+
+    The writer connection lives for the whole process, so an error
+    between its first execute and commit would otherwise leave the
+    transaction open and the next request's commit would silently
+    persist the partial rows.
+    """
+    try:
+        yield _write_conn
+    except Exception:
+        if _write_conn.in_transaction:
+            _write_conn.rollback()
+        raise
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Initialize database on startup"""
-    conn = sqlite3.connect(DB_PATH)
+    # Raise the shared threadpool limit so DB calls from many concurrent
+    # requests don't queue behind anyio's default 40 worker tokens.
+    anyio.to_thread.current_default_thread_limiter().total_tokens = 100
+    conn = _connect()
+    # WAL turns each commit into a sequential append to the -wal file
+    # (one fsync instead of two) and lets readers run alongside the
+    # writer. The setting persists in the database file, so applying it
+    # once at startup covers every later connection.
+    conn.execute("PRAGMA journal_mode=WAL")
     conn.execute(
         """
         CREATE TABLE IF NOT EXISTS signals (
@@ -78,6 +254,12 @@ async def lifespan(app: FastAPI):
         CREATE INDEX IF NOT EXISTS idx_severity
         ON signals(severity)
     """)
+    # The default /signals query filters on status and orders by ts, so
+    # this compound index serves it without a sort step
+    conn.execute("""
+        CREATE INDEX IF NOT EXISTS idx_status_ts
+        ON signals(status, ts DESC)
+    """)
     # Ensure new columns exist for older databases
     cursor = conn.execute("PRAGMA table_info(signals)")
     cols = [row[1] for row in cursor.fetchall()]
@@ -104,21 +286,174 @@ async def lifespan(app: FastAPI):
         CREATE INDEX IF NOT EXISTS idx_heartbeat_agent
         ON heartbeats(agent_id, received_at DESC)
     """)
+    # One row per (signal, tag) so tag lookups hit an index instead of
+    # scanning the JSON blob in signals.tags (kept for responses)
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS signal_tags (
+            signal_id TEXT NOT NULL,
+            tag TEXT NOT NULL,
+            PRIMARY KEY (signal_id, tag)
+        ) WITHOUT ROWID
+        """
+    )
+    conn.execute("""
+        CREATE INDEX IF NOT EXISTS idx_signal_tag
+        ON signal_tags(tag)
+    """)
+    # Pre-aggregated counters for /stats so it reads a handful of rows
+    # instead of GROUP BY scans over the whole signals table. There is
+    # no delete path for signals, so an insert trigger keeps the
+    # counters exact.
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS signal_counts (
+            kind TEXT NOT NULL,
+            key TEXT NOT NULL,
+            count INTEGER NOT NULL DEFAULT 0,
+            PRIMARY KEY (kind, key)
+        ) WITHOUT ROWID
+        """
+    )
+    conn.execute(
+        """
+        CREATE TRIGGER IF NOT EXISTS trg_signal_counts
+        AFTER INSERT ON signals
+        BEGIN
+            INSERT INTO signal_counts VALUES ('total', '', 1)
+                ON CONFLICT(kind, key) DO UPDATE SET count = count + 1;
+            INSERT INTO signal_counts VALUES ('severity', NEW.severity, 1)
+                ON CONFLICT(kind, key) DO UPDATE SET count = count + 1;
+            INSERT INTO signal_counts VALUES ('host', NEW.host_id, 1)
+                ON CONFLICT(kind, key) DO UPDATE SET count = count + 1;
+            INSERT INTO signal_counts VALUES ('rule', NEW.rule_id, 1)
+                ON CONFLICT(kind, key) DO UPDATE SET count = count + 1;
+        END
+        """
+    )
+    # Backfill counters for databases created before the trigger existed
+    counts_missing = conn.execute(
+        "SELECT NOT EXISTS (SELECT 1 FROM signal_counts)"
+        " AND EXISTS (SELECT 1 FROM signals)"
+    ).fetchone()[0]
+    if counts_missing:
+        conn.execute(
+            "INSERT INTO signal_counts SELECT 'total', '', COUNT(*) FROM signals"
+        )
+        conn.execute(
+            "INSERT INTO signal_counts"
+            " SELECT 'severity', severity, COUNT(*) FROM signals GROUP BY severity"
+        )
+        conn.execute(
+            "INSERT INTO signal_counts"
+            " SELECT 'host', host_id, COUNT(*) FROM signals GROUP BY host_id"
+        )
+        conn.execute(
+            "INSERT INTO signal_counts"
+            " SELECT 'rule', rule_id, COUNT(*) FROM signals GROUP BY rule_id"
+        )
+    # Backfill tag rows for databases created before signal_tags existed
+    tag_rows_missing = conn.execute(
+        "SELECT NOT EXISTS (SELECT 1 FROM signal_tags)"
+        " AND EXISTS (SELECT 1 FROM signals)"
+    ).fetchone()[0]
+    if tag_rows_missing:
+        for signal_id, tags in conn.execute(
+            "SELECT signal_id, tags FROM signals WHERE tags IS NOT NULL"
+        ).fetchall():
+            for tag in json.loads(tags or "[]"):
+                conn.execute(_INSERT_TAG_SQL, (signal_id, tag))
     conn.commit()
     conn.close()
     print(f"Database initialized: {DB_PATH}")
+    # The writer must be opened before the read-only pool: an open
+    # read-write connection keeps the WAL shared-memory file alive for
+    # the mode=ro readers.
+    global _write_conn
+    _write_conn = _connect()
+    for _ in range(POOL_SIZE):
+        _read_pool.put(_connect(readonly=True))
     yield
-    # Cleanup on shutdown (if needed)
+    # Close connections on shutdown
+    while not _read_pool.empty():
+        _read_pool.get_nowait().close()
+    _write_conn.close()
+    _write_conn = None
+
+
+app = FastAPI(
+    title="Santamon Backend", version="v0.1", lifespan=lifespan,
+    default_response_class=FastJSONResponse,
+)
+
+# Reject oversized request bodies before any body bytes are parsed or
+# context re-serialized; sized for a full 1000-signal batch. The
+# per-signal 100KB context limit still applies after parsing.
+MAX_BODY_BYTES = 10 * 1024 * 1024
+
+
+@app.middleware("http")
+async def limit_body_size(request, call_next):
+    # Fast path: refuse up front when the client declares the size
+    content_length = request.headers.get("content-length")
+    if content_length and content_length.isdigit() and int(content_length) > MAX_BODY_BYTES:
+        return FastJSONResponse(
+            {"detail": "Request body too large"}, status_code=413
+        )
 
+    # Chunked uploads carry no Content-Length, so also enforce the cap
+    # while the body is being read rather than trusting the header;
+    # stop consuming the moment the stream goes over the limit
+    received = 0
+    chunks = []
+    async for chunk in request.stream():
+        received += len(chunk)
+        if received > MAX_BODY_BYTES:
+            return FastJSONResponse(
+                {"detail": "Request body too large"}, status_code=413
+            )
+        chunks.append(chunk)
 
-app = FastAPI(title="Santamon Backend", version="v0.1", lifespan=lifespan)
+    # Hand the vetted body downstream the same way Request.body() caches
+    # it; BaseHTTPMiddleware replays the cached body to the handler
+    request._body = b"".join(chunks)
+    return await call_next(request)
 
-# Serve the web UI when the static assets are available
+
+# Serve the web UI; check_dir=False skips the import-time existence
+# check, so a missing static/ directory means 404s on /ui instead of a
+# refusal to start
 STATIC_DIR = BASE_DIR / "static"
-if STATIC_DIR.exists():
-    app.mount("/ui", StaticFiles(directory=str(STATIC_DIR), html=True), name="ui")
-else:
-    print(f"Static UI directory not found at {STATIC_DIR}, skipping /ui mount")
+app.mount(
+    "/ui",
+    StaticFiles(directory=str(STATIC_DIR), html=True, check_dir=False),
+    name="ui",
+)
+
+# Non-HTML UI assets change only on deploy, so let browsers cache them
+# briefly instead of re-fetching on every dashboard reload. HTML is the
+# deploy entry point and must always revalidate (no-cache still allows
+# 304s via the ETag), otherwise open browsers keep showing a stale UI
+# for the full max-age after a deploy.
+UI_CACHE_CONTROL = "public, max-age=300"
+UI_HTML_CACHE_CONTROL = "no-cache"
+
+
+@app.middleware("http")
+async def ui_cache_headers(request, call_next):
+    response = await call_next(request)
+    if request.url.path.startswith("/ui") and response.status_code == 200:
+        if response.headers.get("content-type", "").startswith("text/html"):
+            response.headers["Cache-Control"] = UI_HTML_CACHE_CONTROL
+        else:
+            response.headers.setdefault("Cache-Control", UI_CACHE_CONTROL)
+    return response
+
+
+# Closed vocabularies as Literal types so membership is checked inside
+# pydantic-core's C validator instead of per-request Python callbacks
+SignalStatus = Literal["open", "acknowledged", "resolved"]
+SignalSeverity = Literal["low", "medium", "high", "critical"]
 
 
 class Signal(BaseModel):
@@ -127,34 +462,16 @@ class Signal(BaseModel):
     host_id: str = Field(..., max_length=255)
     rule_id: str = Field(..., max_length=64)
     rule_description: Optional[str] = Field(default=None, max_length=2000)
-    status: str = Field(default="open", max_length=32)
-    severity: str = Field(..., max_length=32)
+    status: SignalStatus = "open"
+    severity: SignalSeverity
     title: str = Field(..., max_length=512)
-    tags: List[str] = Field(default_factory=list, max_length=50)
+    tags: List[constr(max_length=64)] = Field(default_factory=list, max_length=50)
     context: dict
 
-    @field_validator('severity')
-    @classmethod
-    def validate_severity(cls, v):
-        allowed = ['low', 'medium', 'high', 'critical']
-        if v not in allowed:
-            raise ValueError(f'severity must be one of {allowed}')
-        return v
-
-    @field_validator('status')
-    @classmethod
-    def validate_status(cls, v):
-        if v not in ALLOWED_STATUSES:
-            raise ValueError(f'status must be one of {sorted(ALLOWED_STATUSES)}')
-        return v
-
-    @field_validator('tags')
-    @classmethod
-    def validate_tags(cls, v):
-        for tag in v:
-            if len(tag) > 64:
-                raise ValueError('tag too long (max 64 characters)')
-        return v
+    @cached_property
+    def tags_json(self) -> str:
+        """Validated tags serialized once, shared by every insert path."""
+        return json.dumps(self.tags) if self.tags else "[]"
 
 
 class Heartbeat(BaseModel):
@@ -165,6 +482,22 @@ class Heartbeat(BaseModel):
     uptime_seconds: Optional[float] = None
 
 
+def _insert_heartbeat(hb: Heartbeat) -> None:
+    with _write_tx() as conn:
+        conn.execute(
+            _INSERT_HEARTBEAT_SQL,
+            (
+                hb.agent_id,
+                hb.timestamp,
+                hb.version,
+                hb.os_version,
+                hb.uptime_seconds,
+                _utcnow_iso(),
+            ),
+        )
+        conn.commit()
+
+
 @app.post("/agents/heartbeat")
 async def heartbeat(
     hb: Heartbeat,
@@ -175,69 +508,90 @@ async def heartbeat(
 
     Authentication via X-API-Key header
     """
-    # Use constant-time comparison to prevent timing attacks
-    if not x_api_key or not secrets.compare_digest(x_api_key, API_KEY):
-        raise HTTPException(status_code=401, detail="Invalid API key")
+    _check_api_key(x_api_key)
 
-    conn = sqlite3.connect(DB_PATH, timeout=5.0)
     try:
-        conn.execute(
-            """
-            INSERT OR REPLACE INTO heartbeats VALUES
-            (?, ?, ?, ?, ?, ?)
-            """,
-            (
-                hb.agent_id,
-                hb.timestamp,
-                hb.version,
-                hb.os_version,
-                hb.uptime_seconds,
-                datetime.utcnow().isoformat(),
-            ),
-        )
-        conn.commit()
+        async with _write_lock:
+            await run_in_threadpool(_insert_heartbeat, hb)
 
-        return {
+        return FastJSONResponse({
             "status": "ok",
             "agent_id": hb.agent_id
-        }
+        })
     except Exception as e:
         raise HTTPException(status_code=500, detail="Internal server error")
-    finally:
-        conn.close()
 
 
 class StatusUpdate(BaseModel):
-    status: str
+    status: SignalStatus
 
-    @field_validator('status')
-    @classmethod
-    def validate_status(cls, v):
-        if v not in ALLOWED_STATUSES:
-            raise ValueError(f'status must be one of {sorted(ALLOWED_STATUSES)}')
-        return v
+
+def _update_status(signal_id: str, status: str) -> int:
+    with _write_tx() as conn:
+        cursor = conn.execute(
+            _UPDATE_STATUS_SQL,
+            (status, signal_id),
+        )
+        conn.commit()
+    return cursor.rowcount
 
 
 @app.patch("/signals/{signal_id}/status")
 async def update_signal_status(signal_id: str, update: StatusUpdate):
     """Update status of a signal (open, acknowledged, resolved)."""
-    conn = sqlite3.connect(DB_PATH, timeout=5.0)
     try:
-        cursor = conn.execute(
-            "UPDATE signals SET status = ? WHERE signal_id = ?",
-            (update.status, signal_id),
-        )
-        conn.commit()
-        updated_rows = cursor.rowcount
+        async with _write_lock:
+            updated_rows = await run_in_threadpool(
+                _update_status, signal_id, update.status
+            )
         if updated_rows == 0:
             raise HTTPException(status_code=404, detail="Signal not found")
-        return {"signal_id": signal_id, "status": update.status}
+        return FastJSONResponse({"signal_id": signal_id, "status": update.status})
     except HTTPException:
         raise
     except Exception:
         raise HTTPException(status_code=500, detail="Internal server error")
-    finally:
-        conn.close()
+
+
+class SignalBatch(BaseModel):
+    signals: List[Signal] = Field(..., min_length=1, max_length=1000)
+
+
+def _signal_row(signal: Signal, context_json: str, received_at: str) -> tuple:
+    return (
+        signal.signal_id,
+        signal.ts,
+        signal.host_id,
+        signal.rule_id,
+        signal.rule_description,
+        signal.status or "open",
+        signal.severity,
+        signal.title,
+        signal.tags_json,
+        context_json,
+        received_at,
+    )
+
+
+def _insert_signal(signal: Signal, context_json: str) -> bool:
+    """Insert one signal on the writer connection; True if it was a duplicate."""
+    with _write_tx() as conn:
+        before_changes = conn.total_changes
+        cursor = conn.execute(
+            _INSERT_SIGNAL_SQL,
+            _signal_row(signal, context_json, _utcnow_iso()),
+        )
+
+        # Determine if the insert succeeded using SQLite change count
+        inserted_rows = cursor.rowcount
+        if inserted_rows == -1:  # Fallback for drivers that do not support rowcount
+            inserted_rows = conn.total_changes - before_changes
+        if inserted_rows > 0 and signal.tags:
+            conn.executemany(
+                _INSERT_TAG_SQL, [(signal.signal_id, tag) for tag in signal.tags]
+            )
+        conn.commit()
+    return inserted_rows == 0
 
 
 @app.post("/ingest")
@@ -250,85 +604,147 @@ async def ingest(
 
     Authentication via X-API-Key header
     """
-    # Use constant-time comparison to prevent timing attacks
-    if not x_api_key or not secrets.compare_digest(x_api_key, API_KEY):
-        raise HTTPException(status_code=401, detail="Invalid API key")
+    _check_api_key(x_api_key)
 
-    # Use connection with timeout
-    conn = sqlite3.connect(DB_PATH, timeout=5.0)
     try:
         # Limit context size to prevent DoS
         context_json = json.dumps(signal.context)
         if len(context_json) > 100000:  # 100KB limit
             raise HTTPException(status_code=413, detail="Context too large")
 
-        before_changes = conn.total_changes
-        cursor = conn.execute(
-            """
-            INSERT OR IGNORE INTO signals (
-                signal_id, ts, host_id, rule_id, rule_description, status,
-                severity, title, tags, context, received_at
-            ) VALUES
-            (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-            (
-                signal.signal_id,
-                signal.ts,
-                signal.host_id,
-                signal.rule_id,
-                signal.rule_description,
-                signal.status or "open",
-                signal.severity,
-                signal.title,
-                json.dumps(signal.tags),
-                json.dumps(signal.context or {}),
-                datetime.utcnow().isoformat(),
-            ),
-        )
-        conn.commit()
-
-        # Determine if the insert succeeded using SQLite change count
-        inserted_rows = cursor.rowcount
-        if inserted_rows == -1:  # Fallback for drivers that do not support rowcount
-            inserted_rows = conn.total_changes - before_changes
+        async with _write_lock:
+            duplicate = await run_in_threadpool(_insert_signal, signal, context_json)
 
-        return {
+        return FastJSONResponse({
             "status": "ok",
             "id": signal.signal_id,
-            "duplicate": inserted_rows == 0
-        }
+            "duplicate": duplicate
+        })
     except HTTPException:
         raise
     except Exception as e:
         # Don't expose internal errors
         raise HTTPException(status_code=500, detail="Internal server error")
-    finally:
-        conn.close()
+
+
+def _insert_signal_batch(entries: List[tuple]) -> int:
+    """Insert a batch of (signal row, tag rows) in one transaction.
+
+    Rows are inserted one by one so each rowcount says whether the
+    signal was new — tag rows for ignored duplicates must not land in
+    signal_tags, where they would diverge from the stored tags blob.
+    The single commit still amortizes the fsync across the batch.
+    Returns the number of rows inserted.
+    """
+    inserted = 0
+    with _write_tx() as conn:
+        for row, tag_rows in entries:
+            # rowcount counts direct changes only, so the stats trigger's
+            # counter upserts don't inflate it
+            if conn.execute(_INSERT_SIGNAL_SQL, row).rowcount > 0:
+                inserted += 1
+                if tag_rows:
+                    conn.executemany(_INSERT_TAG_SQL, tag_rows)
+        conn.commit()
+    return inserted
+
+
+@app.post("/ingest/batch")
+async def ingest_batch(
+    batch: SignalBatch,
+    x_api_key: str = Header(None, alias="X-API-Key")
+):
+    """
+    Ingest a batch of signals in a single transaction (max 1000 per call)
+
+    One commit covers the whole batch, so agents forwarding many events
+    pay one fsync instead of one per signal.
+
+    Authentication via X-API-Key header
+    """
+    _check_api_key(x_api_key)
+
+    received_at = _utcnow_iso()
+    entries = []
+    for signal in batch.signals:
+        # Limit context size to prevent DoS
+        context_json = json.dumps(signal.context)
+        if len(context_json) > 100000:  # 100KB limit
+            raise HTTPException(
+                status_code=413,
+                detail=f"Context too large for signal {signal.signal_id}",
+            )
+        entries.append((
+            _signal_row(signal, context_json, received_at),
+            [(signal.signal_id, tag) for tag in signal.tags],
+        ))
+
+    try:
+        async with _write_lock:
+            inserted = await run_in_threadpool(_insert_signal_batch, entries)
+    except Exception:
+        # Don't expose internal errors
+        raise HTTPException(status_code=500, detail="Internal server error")
+
+    return FastJSONResponse({
+        "status": "ok",
+        "count": len(entries),
+        "inserted": inserted,
+        "duplicates": len(entries) - inserted,
+    })
+
+
+def _fetch_signals(query: str, params: list) -> List[dict]:
+    with get_conn() as conn:
+        cursor = conn.execute(query, params)
+        signals = []
+        for row in cursor:
+            signal = dict(row)
+            if orjson is not None:
+                # tags and context are already stored as JSON text, so
+                # splice them into the response verbatim instead of
+                # decoding here only to re-encode in _conditional_json
+                signal['tags'] = orjson.Fragment(signal['tags'] or "[]")
+                signal['context'] = orjson.Fragment(signal['context'] or "{}")
+            else:
+                signal['tags'] = json.loads(signal['tags']) if signal['tags'] else []
+                signal['context'] = json.loads(signal['context']) if signal['context'] else {}
+            if not signal.get("status"):
+                signal["status"] = "open"
+            signals.append(signal)
+    return signals
 
 
 @app.get("/signals")
 async def list_signals(
+    request: Request,
     since: Optional[str] = Query(None, description="ISO timestamp to filter signals after"),
     severity: Optional[str] = Query(None, description="Filter by severity"),
     host_id: Optional[str] = Query(None, description="Filter by host"),
     status: Optional[str] = Query("open", description="Filter by status: open, acknowledged, resolved, or 'all'"),
+    tag: Optional[str] = Query(None, description="Filter by tag (exact match)"),
     search: Optional[str] = Query(None, description="Search by detection title or rule id"),
+    cursor: Optional[str] = Query(None, description="Opaque pagination cursor from a previous response"),
     limit: int = Query(100, ge=1, le=1000, description="Maximum number of results")
 ):
     """
     List signals with optional filtering
 
-    Returns signals in reverse chronological order
+    Returns signals in reverse chronological order. When more results
+    remain, next_cursor holds an opaque value to pass as ?cursor= for
+    the following page; keyset pagination stays index-driven however
+    deep the caller pages.
     """
-    conn = sqlite3.connect(DB_PATH)
-    conn.row_factory = sqlite3.Row
-
     query = "SELECT * FROM signals WHERE 1=1"
     params = []
 
     if since:
         query += " AND ts > ?"
         params.append(since)
+    if cursor:
+        cursor_ts, cursor_id = _decode_cursor(cursor)
+        query += " AND (ts < ? OR (ts = ? AND signal_id < ?))"
+        params.extend([cursor_ts, cursor_ts, cursor_id])
     if severity:
         query += " AND severity = ?"
         params.append(severity)
@@ -340,68 +756,65 @@ async def list_signals(
             raise HTTPException(status_code=400, detail=f"Invalid status '{status}'. Allowed: {sorted(ALLOWED_STATUSES)} or 'all'")
         query += " AND status = ?"
         params.append(status)
+    if tag:
+        query += (
+            " AND EXISTS (SELECT 1 FROM signal_tags"
+            " WHERE signal_tags.signal_id = signals.signal_id AND tag = ?)"
+        )
+        params.append(tag)
     search_term = search.strip().lower() if search else None
     if search_term:
         query += " AND (LOWER(title) LIKE ? OR LOWER(rule_id) LIKE ?)"
         like = f"%{search_term}%"
         params.extend([like, like])
 
-    query += " ORDER BY ts DESC LIMIT ?"
+    # signal_id breaks ties so the cursor ordering is total
+    query += " ORDER BY ts DESC, signal_id DESC LIMIT ?"
     params.append(limit)
 
-    try:
-        cursor = conn.execute(query, params)
-        signals = []
-        for row in cursor:
-            signal = dict(row)
-            # Parse JSON fields
-            signal['tags'] = json.loads(signal['tags']) if signal['tags'] else []
-            signal['context'] = json.loads(signal['context']) if signal['context'] else {}
-            if not signal.get("status"):
-                signal["status"] = "open"
-            signals.append(signal)
+    signals = await run_in_threadpool(_fetch_signals, query, params)
 
-        return {
-            "count": len(signals),
-            "signals": signals
-        }
-    finally:
-        conn.close()
+    next_cursor = None
+    if len(signals) == limit:
+        last = signals[-1]
+        next_cursor = _encode_cursor(last['ts'], last['signal_id'])
 
+    # Serialized directly (skipping FastAPI's jsonable_encoder pass over
+    # what can be a large payload) with an ETag for conditional GETs
+    return _conditional_json(request, {
+        "count": len(signals),
+        "signals": signals,
+        "next_cursor": next_cursor
+    })
 
-@app.get("/stats")
-async def stats():
-    """
-    Get database statistics
-
-    Returns counts by severity, host, and recent activity
-    """
-    conn = sqlite3.connect(DB_PATH)
 
-    try:
+def _fetch_stats() -> dict:
+    with get_conn() as conn:
         # Total count
-        cursor = conn.execute("SELECT COUNT(*) FROM signals")
-        total = cursor.fetchone()[0]
+        cursor = conn.execute(
+            "SELECT count FROM signal_counts WHERE kind = 'total'"
+        )
+        row = cursor.fetchone()
+        total = row[0] if row else 0
 
         # By severity
         cursor = conn.execute("""
-            SELECT severity, COUNT(*) as count
-            FROM signals
-            GROUP BY severity
+            SELECT key, count FROM signal_counts
+            WHERE kind = 'severity'
             ORDER BY count DESC
         """)
         by_severity = {row[0]: row[1] for row in cursor}
 
         # By host
         cursor = conn.execute("""
-            SELECT host_id, COUNT(*) as count
-            FROM signals
-            GROUP BY host_id
+            SELECT key, count FROM signal_counts
+            WHERE kind = 'host'
             ORDER BY count DESC
         """)
         by_host = {row[0]: row[1] for row in cursor}
 
-        # Recent activity (last 24h)
+        # Recent activity (last 24h); this still scans but stays cheap
+        # via the ts index
         cursor = conn.execute("""
             SELECT COUNT(*) FROM signals
             WHERE ts > datetime('now', '-1 day')
@@ -410,23 +823,50 @@ async def stats():
 
         # Most common rules
         cursor = conn.execute("""
-            SELECT rule_id, COUNT(*) as count
-            FROM signals
-            GROUP BY rule_id
+            SELECT key, count FROM signal_counts
+            WHERE kind = 'rule'
             ORDER BY count DESC
             LIMIT 10
         """)
         top_rules = [{"rule_id": row[0], "count": row[1]} for row in cursor]
 
-        return {
-            "total_signals": total,
-            "last_24h": last_24h,
-            "by_severity": by_severity,
-            "by_host": by_host,
-            "top_rules": top_rules
-        }
-    finally:
-        conn.close()
+    return {
+        "total_signals": total,
+        "last_24h": last_24h,
+        "by_severity": by_severity,
+        "by_host": by_host,
+        "top_rules": top_rules
+    }
+
+
+# /stats is polled by dashboards; a few seconds of staleness is fine
+# and shields the DB from one query burst per open browser tab
+STATS_CACHE_TTL = float(os.getenv("SANTAMON_STATS_TTL", "5"))
+_stats_cache = (0.0, None)
+_stats_lock = asyncio.Lock()
+
+
+@app.get("/stats")
+async def stats(request: Request):
+    """
+    Get database statistics
+
+    Returns counts by severity, host, and recent activity
+    (cached for STATS_CACHE_TTL seconds)
+    """
+    global _stats_cache
+    cached_at, cached = _stats_cache
+    if cached is None or time.monotonic() - cached_at >= STATS_CACHE_TTL:
+        # Coalesce the thundering herd at TTL expiry: one request
+        # recomputes while the rest wait, then find the fresh entry on
+        # the re-check instead of each running _fetch_stats themselves
+        async with _stats_lock:
+            cached_at, cached = _stats_cache
+            if cached is None or time.monotonic() - cached_at >= STATS_CACHE_TTL:
+                cached = await run_in_threadpool(_fetch_stats)
+                _stats_cache = (time.monotonic(), cached)
+
+    return _conditional_json(request, cached)
 
 
 @app.get("/health")
@@ -435,6 +875,13 @@ async def health():
     return {"status": "healthy", "timestamp": datetime.utcnow().isoformat()}
 
 
+def _fetch_agents(window: str, limit: int) -> List[dict]:
+    with get_conn() as conn:
+        cursor = conn.execute(_SELECT_AGENTS_SQL, (window, limit))
+        heartbeats = [dict(row) for row in cursor]
+    return heartbeats
+
+
 @app.get("/agents")
 async def list_agents(
     since: Optional[str] = Query(None, description="ISO timestamp to filter heartbeats after"),
@@ -443,34 +890,11 @@ async def list_agents(
     """
     List agents with their latest heartbeats
     """
-    conn = sqlite3.connect(DB_PATH)
-    conn.row_factory = sqlite3.Row
-
     # Default to last 10 minutes if not provided
     default_since = (datetime.utcnow() - timedelta(minutes=10)).isoformat()
     window = since or default_since
 
-    cursor = conn.execute(
-        """
-        SELECT agent_id, timestamp, version, os_version, uptime_seconds, received_at
-        FROM heartbeats
-        WHERE received_at > ?
-        ORDER BY received_at DESC
-        LIMIT ?
-        """,
-        (window, limit),
-    )
-
-    seen = set()
-    heartbeats = []
-    for row in cursor:
-        agent = row["agent_id"]
-        if agent in seen:
-            continue
-        seen.add(agent)
-        heartbeats.append(dict(row))
-
-    conn.close()
+    heartbeats = await run_in_threadpool(_fetch_agents, window, limit)
     return {"count": len(heartbeats), "heartbeats": heartbeats}
 
 
@@ -482,6 +906,7 @@ async def root():
         "version": "v0.1",
         "endpoints": {
             "POST /ingest": "Receive signals from agents",
+            "POST /ingest/batch": "Receive a batch of signals (max 1000)",
             "GET /signals": "List and filter signals",
             "PATCH /signals/{id}/status": "Update signal status",
             "POST /agents/heartbeat": "Receive agent heartbeat",
@@ -11,7 +11,7 @@ def _create_test_client(tmp_path):
     db_path.parent.mkdir(parents=True, exist_ok=True)
 
     os.environ["SANTAMON_DB_PATH"] = str(db_path)
-    os.environ["SANTAMON_API_KEY"] = "test-api-key"
+    os.environ["SANTAMON_API_KEY"] = "test-api-key-0123456789"
 
     # Ensure a fresh module load with the new environment variables
     sys.modules.pop("backend.backend", None)
@@ -34,7 +34,7 @@ def test_ingest_duplicate_flag(tmp_path):
         "context": {"example": True},
     }
 
-    headers = {"X-API-Key": "test-api-key"}
+    headers = {"X-API-Key": "test-api-key-0123456789"}
 
     with TestClient(backend_module.app) as client:
         first_response = client.post("/ingest", json=payload, headers=headers)
@@ -44,3 +44,202 @@ def test_ingest_duplicate_flag(tmp_path):
         second_response = client.post("/ingest", json=payload, headers=headers)
         assert second_response.status_code == 200
         assert second_response.json()["duplicate"] is True
+
+
+def test_ingest_batch_counts_duplicates(tmp_path):
+    backend_module = _create_test_client(tmp_path)
+
+    def make_signal(signal_id):
+        return {
+            "signal_id": signal_id,
+            "ts": "2024-01-01T00:00:00Z",
+            "host_id": "host-1",
+            "rule_id": "rule-1",
+            "severity": "low",
+            "title": "Test signal",
+            "tags": [],
+            "context": {},
+        }
+
+    headers = {"X-API-Key": "test-api-key-0123456789"}
+
+    with TestClient(backend_module.app) as client:
+        first_response = client.post(
+            "/ingest/batch",
+            json={"signals": [make_signal("batch-1"), make_signal("batch-2")]},
+            headers=headers,
+        )
+        assert first_response.status_code == 200
+        assert first_response.json()["inserted"] == 2
+        assert first_response.json()["duplicates"] == 0
+
+        second_response = client.post(
+            "/ingest/batch",
+            json={"signals": [make_signal("batch-2"), make_signal("batch-3")]},
+            headers=headers,
+        )
+        assert second_response.status_code == 200
+        assert second_response.json()["inserted"] == 1
+        assert second_response.json()["duplicates"] == 1
+
+
+def test_list_signals_tag_filter(tmp_path):
+    backend_module = _create_test_client(tmp_path)
+
+    def make_signal(signal_id, tags):
+        return {
+            "signal_id": signal_id,
+            "ts": "2024-01-01T00:00:00Z",
+            "host_id": "host-1",
+            "rule_id": "rule-1",
+            "severity": "low",
+            "title": "Test signal",
+            "tags": tags,
+            "context": {},
+        }
+
+    headers = {"X-API-Key": "test-api-key-0123456789"}
+
+    with TestClient(backend_module.app) as client:
+        client.post("/ingest", json=make_signal("tagged-1", ["persistence"]), headers=headers)
+        client.post("/ingest", json=make_signal("tagged-2", ["execution"]), headers=headers)
+
+        response = client.get("/signals", params={"tag": "persistence"})
+        assert response.status_code == 200
+        body = response.json()
+        assert body["count"] == 1
+        assert body["signals"][0]["signal_id"] == "tagged-1"
+
+
+def test_duplicate_signal_does_not_rewrite_tags(tmp_path):
+    backend_module = _create_test_client(tmp_path)
+
+    def make_signal(tags):
+        return {
+            "signal_id": "dup-1",
+            "ts": "2024-01-01T00:00:00Z",
+            "host_id": "host-1",
+            "rule_id": "rule-1",
+            "severity": "low",
+            "title": "Test signal",
+            "tags": tags,
+            "context": {},
+        }
+
+    headers = {"X-API-Key": "test-api-key-0123456789"}
+
+    with TestClient(backend_module.app) as client:
+        client.post("/ingest", json=make_signal(["orig"]), headers=headers)
+        client.post("/ingest", json=make_signal(["sneaky"]), headers=headers)
+        client.post(
+            "/ingest/batch",
+            json={"signals": [make_signal(["sneaky-batch"])]},
+            headers=headers,
+        )
+
+        assert client.get("/signals", params={"tag": "sneaky"}).json()["count"] == 0
+        assert client.get("/signals", params={"tag": "sneaky-batch"}).json()["count"] == 0
+        assert client.get("/signals", params={"tag": "orig"}).json()["count"] == 1
+
+
+def test_list_signals_keyset_pagination(tmp_path):
+    backend_module = _create_test_client(tmp_path)
+
+    headers = {"X-API-Key": "test-api-key-0123456789"}
+    signals = [
+        {
+            "signal_id": f"page-{i}",
+            "ts": f"2024-01-01T00:00:0{i}Z",
+            "host_id": "host-1",
+            "rule_id": "rule-1",
+            "severity": "low",
+            "title": "Test signal",
+            "tags": [],
+            "context": {},
+        }
+        for i in range(5)
+    ]
+
+    with TestClient(backend_module.app) as client:
+        client.post("/ingest/batch", json={"signals": signals}, headers=headers)
+
+        first_page = client.get("/signals", params={"limit": 3}).json()
+        assert first_page["count"] == 3
+        assert first_page["next_cursor"] is not None
+
+        second_page = client.get(
+            "/signals", params={"limit": 3, "cursor": first_page["next_cursor"]}
+        ).json()
+        assert second_page["count"] == 2
+
+        first_ids = [s["signal_id"] for s in first_page["signals"]]
+        second_ids = [s["signal_id"] for s in second_page["signals"]]
+        assert sorted(first_ids + second_ids) == [f"page-{i}" for i in range(5)]
+
+
+def test_cursor_handles_pipe_in_signal_id(tmp_path):
+    backend_module = _create_test_client(tmp_path)
+
+    headers = {"X-API-Key": "test-api-key-0123456789"}
+    # Identical ts so pagination tie-breaks on the signal_id, which
+    # contains the old cursor delimiter
+    signals = [
+        {
+            "signal_id": f"rule|host|{i}",
+            "ts": "2024-01-01T00:00:00Z",
+            "host_id": "host-1",
+            "rule_id": "rule-1",
+            "severity": "low",
+            "title": "Test signal",
+            "tags": [],
+            "context": {},
+        }
+        for i in range(5)
+    ]
+
+    with TestClient(backend_module.app) as client:
+        client.post("/ingest/batch", json={"signals": signals}, headers=headers)
+
+        first_page = client.get("/signals", params={"limit": 3}).json()
+        second_page = client.get(
+            "/signals", params={"limit": 3, "cursor": first_page["next_cursor"]}
+        ).json()
+        assert second_page["count"] == 2
+
+        ids = [s["signal_id"] for s in first_page["signals"] + second_page["signals"]]
+        assert sorted(ids) == [f"rule|host|{i}" for i in range(5)]
+
+        bad_cursor = client.get("/signals", params={"cursor": "ts|rule|host|1"})
+        assert bad_cursor.status_code == 400
+
+
+def test_oversized_chunked_body_rejected(tmp_path):
+    backend_module = _create_test_client(tmp_path)
+
+    def oversized_chunks():
+        chunk = b"x" * 65536
+        for _ in range(200):  # ~13MB, above MAX_BODY_BYTES
+            yield chunk
+
+    headers = {
+        "X-API-Key": "test-api-key-0123456789",
+        "Content-Type": "application/json",
+        "Transfer-Encoding": "chunked",
+    }
+
+    with TestClient(backend_module.app) as client:
+        response = client.post("/ingest", content=oversized_chunks(), headers=headers)
+        assert response.status_code == 413
+
+
+def test_list_signals_conditional_get(tmp_path):
+    backend_module = _create_test_client(tmp_path)
+
+    with TestClient(backend_module.app) as client:
+        first_response = client.get("/signals")
+        assert first_response.status_code == 200
+        etag = first_response.headers["etag"]
+
+        second_response = client.get("/signals", headers={"If-None-Match": etag})
+        assert second_response.status_code == 304
+        assert second_response.headers["etag"] == etag